@@ -5,10 +5,13 @@ This includes PostgresStream and PostgresConnector.
 
 from __future__ import annotations
 
+import contextlib
 import datetime
 import functools
 import json
-import select
+import selectors
+import threading
+import time
 import typing as t
 from types import MappingProxyType
 
@@ -23,12 +26,15 @@ from singer_sdk.helpers._state import increment_state
 from singer_sdk.helpers._typing import TypeConformanceLevel
 from singer_sdk.streams.core import REPLICATION_INCREMENTAL
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.reflection import ObjectKind
 
 if t.TYPE_CHECKING:
     from collections.abc import Iterable, Mapping
 
+    from singer_sdk.connectors.sql import FullyQualifiedName
     from singer_sdk.helpers.types import Context
     from sqlalchemy.engine import Engine
+    from sqlalchemy.engine.interfaces import ReflectedColumn
     from sqlalchemy.engine.reflection import Inspector
 
 
@@ -45,8 +51,8 @@ class PostgresSQLToJSONSchema(SQLToJSONSchema):
     def from_config(cls, config: dict) -> PostgresSQLToJSONSchema:
         """Instantiate the SQL to JSON Schema converter from a config dictionary."""
         return cls(
-            dates_as_string=config["dates_as_string"],
-            json_as_object=config["json_as_object"],
+            dates_as_string=config.get("dates_as_string", False),
+            json_as_object=config.get("json_as_object", False),
         )
 
     @functools.singledispatchmethod
@@ -88,7 +94,10 @@ class PostgresSQLToJSONSchema(SQLToJSONSchema):
 
 
 def patched_conform(elem: t.Any, property_schema: dict) -> t.Any:
-    """Overrides Singer SDK type conformance.
+    """Conform a value the way Singer SDK type conformance would, with fixes.
+
+    The streams in this tap skip the SDK's own conformance and use this instead, for
+    the columns whose values need it (see PostgresStream.column_conformer).
 
     Most logic here is from singer_sdk.helpers._typing._conform_primitive_property, as
     marked by "# copied". This is a full override rather than calling the "super"
@@ -97,7 +106,7 @@ def patched_conform(elem: t.Any, property_schema: dict) -> t.Any:
     anywhere. Therefore, a jsonschema type like ["boolean", "integer"] will return true
     and will have its values coerced to either True or False. In practice, this occurs
     for columns with JSONB type: no guarantees can be made about their data, so the
-    schema has every possible data type, including boolean. Without this override, all
+    schema has every possible data type, including boolean. With the SDK's logic, all
     JSONB columns would be coerced to True or False.
 
     Modifications:
@@ -109,32 +118,115 @@ def patched_conform(elem: t.Any, property_schema: dict) -> t.Any:
     Returns:
         The appropriate json compatible type.
     """
-    if isinstance(elem, datetime.date):  # not copied, original logic
-        return elem.isoformat()
-    if isinstance(elem, (datetime.datetime,)):  # copied
-        return singer_sdk.helpers._typing.to_json_compatible(elem)
-    if isinstance(elem, datetime.timedelta):  # copied
-        epoch = datetime.datetime.fromtimestamp(0, datetime.timezone.utc)
-        timedelta_from_epoch = epoch + elem
-        if timedelta_from_epoch.tzinfo is None:
-            timedelta_from_epoch = timedelta_from_epoch.replace(
-                tzinfo=datetime.timezone.utc
-            )
-        return timedelta_from_epoch.isoformat()
-    if isinstance(elem, datetime.time):  # copied
-        return str(elem)
-    if isinstance(elem, bytes):  # copied, modified to import is_boolean_type
-        # for BIT value, treat 0 as False and anything else as True
-        # Will only due this for booleans, not `bytea` data.
-        return (
-            elem != b"\x00"
-            if singer_sdk.helpers._typing.is_boolean_type(property_schema)
-            else elem.hex()
-        )
+    elem_type = type(elem)
+    if elem_type in _JSON_PRIMITIVE_TYPES:
+        return elem
+    conformer = _CONFORMERS.get(elem_type)
+    if conformer is not None:
+        return conformer(elem, property_schema)
+    # Subclasses of the conformed types, e.g. pendulum.DateTime, miss the exact-type
+    # lookup above and are matched here instead.
+    for base_type, conformer in _CONFORMERS.items():
+        if isinstance(elem, base_type):
+            return conformer(elem, property_schema)
     return elem
 
 
-singer_sdk.helpers._typing._conform_primitive_property = patched_conform
+def _conform_date(elem: datetime.date, property_schema: dict) -> str:
+    """Conform a date or datetime to its ISO 8601 representation."""
+    # not copied, original logic: prevents dates from turning into datetimes
+    return elem.isoformat()
+
+
+def _conform_timedelta(elem: datetime.timedelta, property_schema: dict) -> str:
+    """Conform a timedelta to the ISO 8601 timestamp that far from the epoch."""
+    # copied
+    epoch = datetime.datetime.fromtimestamp(0, datetime.timezone.utc)
+    timedelta_from_epoch = epoch + elem
+    if timedelta_from_epoch.tzinfo is None:
+        timedelta_from_epoch = timedelta_from_epoch.replace(
+            tzinfo=datetime.timezone.utc
+        )
+    return timedelta_from_epoch.isoformat()
+
+
+def _conform_time(elem: datetime.time, property_schema: dict) -> str:
+    """Conform a time to its string representation."""
+    # copied
+    return str(elem)
+
+
+def _conform_bytes(elem: bytes, property_schema: dict) -> bool | str:
+    """Conform a BIT value to a boolean, or any other bytes to a hex string."""
+    # copied, modified to import is_boolean_type
+    # for BIT value, treat 0 as False and anything else as True
+    # Will only due this for booleans, not `bytea` data.
+    return (
+        elem != b"\x00"
+        if singer_sdk.helpers._typing.is_boolean_type(property_schema)
+        else elem.hex()
+    )
+
+
+# Types of the values patched_conform returns unchanged, which most values are.
+_JSON_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Conformer for each type of value patched_conform converts, looked up by exact type.
+# Subclasses fall back to isinstance checks in this order.
+_CONFORMERS: dict[type, t.Callable[[t.Any, dict], t.Any]] = {
+    datetime.datetime: _conform_date,
+    datetime.date: _conform_date,
+    datetime.timedelta: _conform_timedelta,
+    datetime.time: _conform_time,
+    bytes: _conform_bytes,
+}
+
+
+# Conformer of the values of columns of each SQL type, checked in order. Columns of
+# any other SQL type not listed in _SQL_TYPES_NOT_CONFORMED are conformed generically.
+_SQL_TYPE_CONFORMERS: tuple[
+    tuple[tuple[type, ...], t.Callable[[t.Any, dict], t.Any]], ...
+] = (
+    ((sqlalchemy.types.Date, sqlalchemy.types.DateTime), _conform_date),
+    ((sqlalchemy.types.Time,), _conform_time),
+    ((sqlalchemy.types.Interval, postgresql.INTERVAL), _conform_timedelta),
+    ((sqlalchemy.types.LargeBinary,), _conform_bytes),
+)
+
+# SQL types whose values patched_conform always passes through unchanged, so are not
+# conformed at all.
+_SQL_TYPES_NOT_CONFORMED: tuple[type, ...] = (
+    sqlalchemy.types.String,
+    sqlalchemy.types.Integer,
+    sqlalchemy.types.Numeric,
+    sqlalchemy.types.Boolean,
+    sqlalchemy.types.Uuid,
+    sqlalchemy.types.JSON,
+    sqlalchemy.types.ARRAY,
+)
+
+# Type casters reading date, timestamp and timestamptz values, and arrays of them, as
+# strings. Casters are process-wide psycopg2 state, so they are only built once here
+# and only ever registered once, no matter how many connectors are created.
+_STRING_DATES = psycopg2.extensions.new_type(
+    (1082, 1114, 1184), "STRING_DATES", psycopg2.STRING
+)
+_STRING_DATE_ARRAYS = psycopg2.extensions.new_array_type(
+    (1182, 1115, 1188), "STRING_DATE_ARRAYS[]", psycopg2.STRING
+)
+_string_date_types_lock = threading.Lock()
+_string_date_types_registered = False
+
+
+def _register_string_date_types() -> None:
+    """Register psycopg2 type casters reading dates and timestamps as strings."""
+    global _string_date_types_registered  # noqa: PLW0603
+    with _string_date_types_lock:
+        if _string_date_types_registered:
+            return
+        psycopg2.extensions.register_type(_STRING_DATES)
+        psycopg2.extensions.register_type(_STRING_DATE_ARRAYS)
+        _string_date_types_registered = True
 
 
 class PostgresConnector(SQLConnector):
@@ -154,21 +246,120 @@ class PostgresConnector(SQLConnector):
           sqlalchemy_url: Optional URL for the connection.
 
         """
+        super().__init__(config=config, sqlalchemy_url=sqlalchemy_url)
+
         # Dates in postgres don't all convert to python datetime objects, so we
         # need to register a custom type caster to convert these to a string
         # See https://www.psycopg.org/psycopg3/docs/advanced/adapt.html#example-handling-infinity-date # noqa: E501
         # For more information
-        if config is not None and config["dates_as_string"] is True:
-            string_dates = psycopg2.extensions.new_type(
-                (1082, 1114, 1184), "STRING_DATES", psycopg2.STRING
-            )
-            string_date_arrays = psycopg2.extensions.new_array_type(
-                (1182, 1115, 1188), "STRING_DATE_ARRAYS[]", psycopg2.STRING
-            )
-            psycopg2.extensions.register_type(string_dates)
-            psycopg2.extensions.register_type(string_date_arrays)
+        if self._dates_as_string:
+            _register_string_date_types()
 
-        super().__init__(config=config, sqlalchemy_url=sqlalchemy_url)
+    @functools.cached_property
+    def _dates_as_string(self) -> bool:
+        """Whether date and timestamp values are read as strings."""
+        return bool(self.config.get("dates_as_string", False))
+
+    @functools.cached_property
+    def inspector(self) -> Inspector:
+        """An inspector shared by all reflection done through this connector.
+
+        Reusing one inspector keeps its info_cache, so each table or schema is only
+        reflected from the database once.
+        """
+        return sa.inspect(self._engine)
+
+    def get_table_columns(
+        self,
+        full_table_name: str | FullyQualifiedName,
+        column_names: list[str] | None = None,
+    ) -> dict[str, sa.Column]:
+        """Return a dict of table columns, reflected through the shared inspector.
+
+        Args:
+            full_table_name: Fully qualified table name.
+            column_names: A list of column names to filter to.
+
+        Returns:
+            An ordered mapping of column name to column object.
+        """
+        selected = (
+            frozenset(name.casefold() for name in column_names)
+            if column_names
+            else None
+        )
+        # Cached per column filter, so callers asking for different columns of the
+        # same table each get their own columns.
+        key = (str(full_table_name), selected)
+        if key not in self._table_columns:
+            _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+            self._table_columns[key] = {
+                col_meta["name"]: sa.Column(
+                    col_meta["name"],
+                    col_meta["type"],
+                    nullable=col_meta.get("nullable", False),
+                )
+                for col_meta in self._reflect_columns(schema_name, table_name)
+                if selected is None or col_meta["name"].casefold() in selected
+            }
+        return self._table_columns[key]
+
+    @functools.cached_property
+    def _table_columns(
+        self,
+    ) -> dict[tuple[str, frozenset[str] | None], dict[str, sa.Column]]:
+        """The columns built for each table, by table name and column filter."""
+        return {}
+
+    def _reflect_columns(
+        self, schema_name: str | None, table_name: str
+    ) -> list[ReflectedColumn]:
+        """Return the reflected columns of a table.
+
+        The columns of every table and view in the schema are reflected together the
+        first time a table in it is requested, in one query rather than one per table.
+        """
+        if schema_name not in self._schema_columns:
+            self._schema_columns[schema_name] = {
+                name: columns
+                for (_, name), columns in self.inspector.get_multi_columns(
+                    schema=schema_name, kind=ObjectKind.ANY
+                ).items()
+            }
+        columns = self._schema_columns[schema_name].get(table_name)
+        if columns is None:
+            # Not in the bulk reflection, e.g. created since. Reflect it on its own,
+            # which also raises NoSuchTableError if it doesn't exist.
+            columns = self.inspector.get_columns(table_name, schema_name)
+        return columns
+
+    @functools.cached_property
+    def _schema_columns(self) -> dict[str | None, dict[str, list[ReflectedColumn]]]:
+        """The reflected columns of each table, by schema and then table name."""
+        return {}
+
+    def table_exists(self, full_table_name: str | FullyQualifiedName) -> bool:
+        """Determine if the target table already exists.
+
+        Args:
+            full_table_name: the target table name.
+
+        Returns:
+            True if table exists, False if not.
+        """
+        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+        return self.inspector.has_table(table_name, schema_name)
+
+    def schema_exists(self, schema_name: str) -> bool:
+        """Determine if the target database schema already exists.
+
+        Args:
+            schema_name: The target database schema name.
+
+        Returns:
+            True if the database schema exists, False if not.
+        """
+        return schema_name in self.inspector.get_schema_names()
 
     def get_schema_names(self, engine: Engine, inspected: Inspector) -> list[str]:
         """Return a list of schema names in DB, or overrides with user-provided values.
@@ -191,13 +382,139 @@ class PostgresStream(SQLStream):
     connector_class = PostgresConnector
     supports_nulls_first = True
 
-    # JSONB Objects won't be selected without type_conformance_level to ROOT_ONLY
-    TYPE_CONFORMANCE_LEVEL = TypeConformanceLevel.ROOT_ONLY
+    # Records are conformed in get_records, and only for the columns whose values need
+    # it (see column_conformer), so the SDK's per-value pass is skipped entirely.
+    TYPE_CONFORMANCE_LEVEL = TypeConformanceLevel.NONE
 
     def max_record_count(self) -> int | None:
         """Return the maximum number of records to fetch in a single query."""
         return self.config.get("max_record_count")
 
+    def fetch_size(self) -> int:
+        """Return the number of rows to fetch from the server in a single round trip."""
+        return self.config.get("fetch_size", 5000)
+
+    def column_conformer(self, column: sa.Column) -> t.Callable[[t.Any], t.Any] | None:
+        """Return the function conforming the values of a column, if they need it.
+
+        The conformer is picked once from the column's SQL type, rather than by
+        inspecting every value.
+
+        Args:
+            column: The column being read.
+
+        Returns:
+            The conformer, or None if the column's values are used as they are.
+        """
+        column_type = column.type
+        while isinstance(column_type, postgresql.DOMAIN):
+            # Values of a domain are read as values of its underlying type.
+            column_type = column_type.data_type
+        if _string_date_types_registered and isinstance(
+            column_type, (sqlalchemy.types.Date, sqlalchemy.types.DateTime)
+        ):
+            # These values are already read as strings. The casters doing so are
+            # process-wide, so this holds once any connector has registered them,
+            # whatever this stream's own dates_as_string setting.
+            return None
+        if isinstance(column_type, _SQL_TYPES_NOT_CONFORMED):
+            return None
+        for sql_types, conform in _SQL_TYPE_CONFORMERS:
+            if isinstance(column_type, sql_types):
+                break
+        else:
+            # Values of BIT columns, of columns whose type could not be reflected, and
+            # of any other type, are not of one known Python type, so they are
+            # conformed generically.
+            conform = patched_conform
+
+        properties = self.schema["properties"]
+        property_schema = properties.get(column.name)
+        if property_schema is None:
+            # The catalog may name the column in a different case than the database.
+            property_schema = next(
+                (
+                    schema
+                    for name, schema in properties.items()
+                    if name.casefold() == column.name.casefold()
+                ),
+                {},
+            )
+
+        if conform is _conform_bytes:
+            # Whether the bytes are a BIT value depends only on the column's schema,
+            # so it is checked here once rather than for every value.
+            is_boolean = singer_sdk.helpers._typing.is_boolean_type(property_schema)
+
+            def bytes_conformer(value: t.Any) -> t.Any:
+                if value is None:
+                    return None
+                return value != b"\x00" if is_boolean else value.hex()
+
+            return bytes_conformer
+
+        def conformer(value: t.Any) -> t.Any:
+            return value if value is None else conform(value, property_schema)
+
+        return conformer
+
+    @functools.cached_property
+    def _selected_column_names(self) -> list[str]:
+        """Return the names of the selected columns, in schema order."""
+        return list(self.get_selected_schema()["properties"])
+
+    @functools.cached_property
+    def _table(self) -> sa.Table:
+        """Return the reflected table, restricted to the selected columns."""
+        return self.connector.get_table(
+            full_table_name=self.fully_qualified_name,
+            column_names=self._selected_column_names,
+        )
+
+    @functools.cached_property
+    def _base_query(self) -> sa.Select:
+        """Return the SELECT of the selected columns, ordered by the replication key.
+
+        The bookmark filter and limit are applied per call in get_records, so the
+        reflection and construction here are only done once per stream.
+        """
+        table = self._table
+        # The table is already narrowed to the selected columns, matched without
+        # regard to case and without any dropped since discovery. Projecting them
+        # means unselected (possibly large or TOASTed) columns are never read or sent
+        # over the wire.
+        query = sa.select(*table.columns)
+        if self.replication_key:
+            replication_key_col = table.columns[self.replication_key]
+            order_by = replication_key_col.asc()
+            if self.supports_nulls_first and replication_key_col.nullable:
+                # Rows without a replication key value come first. This is left out
+                # for NOT NULL columns, where it changes nothing but would stop the
+                # planner from reading in the order of a default (NULLS LAST) index.
+                order_by = sa.nulls_first(order_by)
+            query = query.order_by(order_by)
+        return query
+
+    @staticmethod
+    def _conform_rows(
+        rows: t.Sequence[t.Sequence[t.Any]],
+        conformers: t.Iterable[tuple[int, t.Callable[[t.Any], t.Any]]],
+    ) -> t.Iterable[tuple[t.Any, ...]]:
+        """Conform a batch of rows a column at a time.
+
+        Args:
+            rows: The rows as fetched from the database.
+            conformers: The position and conformer of each column whose values need
+                conforming.
+
+        Returns:
+            The conformed rows, as tuples.
+        """
+        columns = list(zip(*rows))
+        for index, conformer in conformers:
+            columns[index] = tuple(map(conformer, columns[index]))
+        return zip(*columns)
+
     # Get records from stream
     def get_records(self, context: Context | None) -> t.Iterable[dict[str, t.Any]]:
         """Return a generator of record-type dictionary objects.
@@ -221,45 +538,76 @@ class PostgresStream(SQLStream):
             msg = f"Stream '{self.name}' does not support partitioning."
             raise NotImplementedError(msg)
 
-        selected_column_names = self.get_selected_schema()["properties"].keys()
-        table = self.connector.get_table(
-            full_table_name=self.fully_qualified_name,
-            column_names=selected_column_names,
-        )
-        query = table.select()
+        table = self._table
+        query = self._base_query
 
         if self.replication_key:
             replication_key_col = table.columns[self.replication_key]
-            order_by = (
-                sa.nulls_first(replication_key_col.asc())
-                if self.supports_nulls_first
-                else replication_key_col.asc()
-            )
-            query = query.order_by(order_by)
-
             start_val = self.get_starting_replication_key_value(context)
             if start_val:
                 query = query.where(replication_key_col >= start_val)
 
+        limits = []
         if self.ABORT_AT_RECORD_COUNT is not None:
             # Limit record count to one greater than the abort threshold. This ensures
             # `MaxRecordsLimitException` exception is properly raised by caller
             # `Stream._sync_records()` if more records are available than can be
             # processed.
-            query = query.limit(self.ABORT_AT_RECORD_COUNT + 1)
+            limits.append(self.ABORT_AT_RECORD_COUNT + 1)
+        if max_record_count := self.max_record_count():
+            limits.append(max_record_count)
+        if limits:
+            query = query.limit(min(limits))
 
-        if self.max_record_count():
-            query = query.limit(self.max_record_count())
+        # Stream the result through a server-side cursor, fetching `fetch_size` rows
+        # per round trip instead of buffering the whole table client-side.
+        fetch_size = self.fetch_size()
+        query = query.execution_options(stream_results=True, yield_per=fetch_size)
 
         with self.connector._connect() as conn:
-            for record in conn.execute(query).mappings():
-                # TODO: Standardize record mapping type
-                # https://github.com/meltano/sdk/issues/2096
-                transformed_record = self.post_process(dict(record))
-                if transformed_record is None:
-                    # Record filtered out during post_process()
-                    continue
-                yield transformed_record
+            result = conn.execute(query)
+            # Build plain dicts from the row tuples directly rather than through a
+            # RowMapping per row, with the lookups hoisted out of the loop.
+            keys = tuple(result.keys())
+            conformers = tuple(
+                (keys.index(column.name), conformer)
+                for column in table.columns
+                if (conformer := self.column_conformer(column)) is not None
+            )
+            post_process = self.post_process
+            for partition in result.partitions(fetch_size):
+                rows: t.Iterable[t.Sequence[t.Any]] = partition
+                if conformers:
+                    rows = self._conform_rows(partition, conformers)
+                for row in rows:
+                    transformed_record = post_process(dict(zip(keys, row)))
+                    if transformed_record is None:
+                        # Record filtered out during post_process()
+                        continue
+                    yield transformed_record
+
+
+def _nullable_type(json_type: str | list[str]) -> list[str]:
+    """Return a JSON schema type as a list that includes "null"."""
+    types = json_type if isinstance(json_type, list) else [json_type]
+    return types if "null" in types else [*types, "null"]
+
+
+def _format_utc_timestamp(seconds: int) -> str:
+    """Format a Unix timestamp as an ISO 8601 UTC string, e.g. 2024-01-31T12:00:00Z."""
+    tm = time.gmtime(seconds)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}Z"
+    )
+
+
+# When using log based replication, the wal2json output for columns of
+# array types returns a string encoded in sql format, e.g. '{a,b}'
+# https://github.com/eulerto/wal2json/issues/221#issuecomment-1025143441
+_WAL2JSON_PARSERS: dict[str, t.Callable] = {
+    "text[]": psycopg2.extensions.STRINGARRAY,
+}
 
 
 class PostgresLogBasedStream(SQLStream):
@@ -267,29 +615,38 @@ class PostgresLogBasedStream(SQLStream):
 
     connector_class = PostgresConnector
 
-    # JSONB Objects won't be selected without type_conformance_level to ROOT_ONLY
-    TYPE_CONFORMANCE_LEVEL = TypeConformanceLevel.ROOT_ONLY
+    # wal2json values are already JSON primitives, objects and arrays, so there is
+    # nothing to conform. Columns missing from the schema are dropped in consume.
+    TYPE_CONFORMANCE_LEVEL = TypeConformanceLevel.NONE
 
     replication_key = "_sdc_lsn"
 
-    @property
+    # Second and formatted string of the last _sdc_deleted_at timestamp
+    _deleted_at_second: int = -1
+    _deleted_at: str = ""
+
+    @functools.cached_property
     def config(self) -> Mapping[str, t.Any]:
-        """Return a read-only config dictionary."""
+        """Return a read-only config dictionary.
+
+        The proxy is a live view of `_config`, so it only needs to be built once.
+        """
         return MappingProxyType(self._config)
 
     @functools.cached_property
     def schema(self) -> dict:
         """Override schema for log-based replication adding _sdc columns."""
         schema_dict = t.cast(dict, self._singer_catalog_entry.schema.to_dict())
-        for property in schema_dict["properties"].values():
-            if isinstance(property["type"], list):
-                property["type"].append("null")
-            else:
-                property["type"] = [property["type"], "null"]
-        if "required" in schema_dict:
-            schema_dict.pop("required")
-        schema_dict["properties"].update({"_sdc_deleted_at": {"type": ["string"]}})
-        schema_dict["properties"].update({"_sdc_lsn": {"type": ["integer"]}})
+        # Build new property dicts rather than mutating the catalog's in place, so
+        # computing the schema again never appends "null" a second time.
+        properties = {
+            name: {**property, "type": _nullable_type(property["type"])}
+            for name, property in schema_dict["properties"].items()
+        }
+        properties["_sdc_deleted_at"] = {"type": ["string"]}
+        properties["_sdc_lsn"] = {"type": ["integer"]}
+        schema_dict["properties"] = properties
+        schema_dict.pop("required", None)
         return schema_dict
 
     def _increment_stream_state(
@@ -333,60 +690,83 @@ class PostgresLogBasedStream(SQLStream):
         start_lsn = self.get_starting_replication_key_value(context=context)
         if start_lsn is None:
             start_lsn = 0
-        logical_replication_connection = self.logical_replication_connection()
-        logical_replication_cursor = logical_replication_connection.cursor()
-
-        # Flush logs from the previous sync. send_feedback() will only flush LSNs before
-        # the value of flush_lsn, not including the value of flush_lsn, so this is safe
-        # even though we still want logs with an LSN == start_lsn.
-        logical_replication_cursor.send_feedback(flush_lsn=start_lsn)
-
-        # get the slot name from the configuration or use the default value
-        replication_slot_name = self.config.get("replication_slot_name", "tappostgres")
-
-        logical_replication_cursor.start_replication(
-            slot_name=replication_slot_name,  # use slot name
-            decode=True,
-            start_lsn=start_lsn,
-            status_interval=status_interval,
-            options={
-                "format-version": 2,
-                "include-transaction": False,
-                "add-tables": self.fully_qualified_name,
-            },
-        )
+        with contextlib.ExitStack() as cleanup:
+            # Release the replication connection, and with it the slot, however the
+            # generator ends, including when it is closed early or reading fails
+            # part-way through.
+            logical_replication_connection = self.logical_replication_connection()
+            cleanup.callback(logical_replication_connection.close)
+            logical_replication_cursor = logical_replication_connection.cursor()
+            cleanup.callback(logical_replication_cursor.close)
+            selector = cleanup.enter_context(selectors.DefaultSelector())
+
+            # Flush logs from the previous sync. send_feedback() will only flush LSNs
+            # before the value of flush_lsn, not including the value of flush_lsn, so
+            # this is safe even though we still want logs with an LSN == start_lsn.
+            logical_replication_cursor.send_feedback(flush_lsn=start_lsn)
+
+            # get the slot name from the configuration or use the default value
+            replication_slot_name = self.config.get(
+                "replication_slot_name", "tappostgres"
+            )
 
-        # Using scaffolding layout from:
-        # https://www.psycopg.org/docs/extras.html#psycopg2.extras.ReplicationCursor
-        while True:
-            message = logical_replication_cursor.read_message()
-            if message:
-                row = self.consume(message, logical_replication_cursor)
-                if row:
-                    yield row
-            else:
-                timeout = (
-                    status_interval
-                    - (
-                        datetime.datetime.now()
-                        - logical_replication_cursor.feedback_timestamp
-                    ).total_seconds()
-                )
-                try:
+            logical_replication_cursor.start_replication(
+                slot_name=replication_slot_name,  # use slot name
+                decode=True,
+                start_lsn=start_lsn,
+                status_interval=status_interval,
+                options={
+                    "format-version": 2,
+                    "include-transaction": False,
+                    "add-tables": self.fully_qualified_name,
+                },
+            )
+
+            selector.register(logical_replication_cursor, selectors.EVENT_READ)
+            # Monotonic time at which an idle stream is considered complete, set
+            # when read_message() first comes back empty after receiving messages.
+            idle_deadline: float | None = None
+
+            # Using scaffolding layout from:
+            # https://www.psycopg.org/docs/extras.html#psycopg2.extras.ReplicationCursor
+            wal_batch_size = self.config.get("wal_batch_size", 1000)
+            batch: list[dict[str, t.Any]] = []
+            while True:
+                message = logical_replication_cursor.read_message()
+                if message:
+                    idle_deadline = None
+                    row = self.consume(message, logical_replication_cursor)
+                    if row:
+                        batch.append(row)
+                        if len(batch) >= wal_batch_size:
+                            yield from self._flush_batch(
+                                batch, logical_replication_cursor
+                            )
+                else:
+                    if batch:
+                        yield from self._flush_batch(batch, logical_replication_cursor)
+                    if idle_deadline is None:
+                        idle_deadline = time.monotonic() + status_interval
                     # If the timeout has passed and the cursor still has no new
                     # messages, the sync has completed.
-                    if (
-                        select.select(
-                            [logical_replication_cursor], [], [], max(0, timeout)
-                        )[0]
-                        == []
-                    ):
+                    if not selector.select(max(0, idle_deadline - time.monotonic())):
                         break
-                except InterruptedError:
-                    pass
 
-        logical_replication_cursor.close()
-        logical_replication_connection.close()
+    def _flush_batch(
+        self,
+        batch: list[dict[str, t.Any]],
+        cursor,
+    ) -> Iterable[dict[str, t.Any]]:
+        """Yield and clear a batch of rows, then report the last LSN as written.
+
+        Only write_lsn is reported: WAL is not released from the replication slot
+        until a later sync flushes its starting bookmark. psycopg2 sends the
+        feedback with its next periodic status update rather than immediately.
+        """
+        last_lsn = batch[-1]["_sdc_lsn"]
+        yield from batch
+        cursor.send_feedback(write_lsn=last_lsn)
+        batch.clear()
 
     def consume(self, message, cursor) -> dict | None:
         """Ingest WAL message."""
@@ -399,46 +779,8 @@ class PostgresLogBasedStream(SQLStream):
             )
             return {}
 
-        row = {}
-
-        upsert_actions = {"I", "U"}
-        delete_actions = {"D"}
-        truncate_actions = {"T"}
-        transaction_actions = {"B", "C"}
-
-        if message_payload["action"] in upsert_actions:
-            for column in message_payload["columns"]:
-                row.update({column["name"]: self._parse_column_value(column, cursor)})
-            row.update({"_sdc_deleted_at": None})
-            row.update({"_sdc_lsn": message.data_start})
-        elif message_payload["action"] in delete_actions:
-            for column in message_payload["identity"]:
-                row.update({column["name"]: self._parse_column_value(column, cursor)})
-            row.update(
-                {
-                    "_sdc_deleted_at": datetime.datetime.utcnow().strftime(
-                        r"%Y-%m-%dT%H:%M:%SZ"
-                    )
-                }
-            )
-            row.update({"_sdc_lsn": message.data_start})
-        elif message_payload["action"] in truncate_actions:
-            self.logger.debug(
-                (
-                    "A message payload of %s (corresponding to a truncate action) "
-                    "could not be processed."
-                ),
-                message.payload,
-            )
-        elif message_payload["action"] in transaction_actions:
-            self.logger.debug(
-                (
-                    "A message payload of %s (corresponding to a transaction beginning "
-                    "or commit) could not be processed."
-                ),
-                message.payload,
-            )
-        else:
+        handler = self._ACTION_HANDLERS.get(message_payload["action"])
+        if handler is None:
             raise RuntimeError(
                 (
                     "A message payload of %s (corresponding to an unknown action type) "
@@ -446,36 +788,114 @@ class PostgresLogBasedStream(SQLStream):
                 ),
                 message.payload,
             )
+        return handler(self, message, message_payload, cursor)
+
+    def _consume_upsert(self, message, message_payload, cursor) -> dict:
+        """Build a row from an insert or update WAL message."""
+        properties = self.schema["properties"]
+        row = {
+            column["name"]: self._parse_column_value(column, cursor)
+            for column in message_payload["columns"]
+            if column["name"] in properties
+        }
+        row["_sdc_deleted_at"] = None
+        row["_sdc_lsn"] = message.data_start
+        return row
 
+    def _consume_delete(self, message, message_payload, cursor) -> dict:
+        """Build a row from a delete WAL message."""
+        properties = self.schema["properties"]
+        row = {
+            column["name"]: self._parse_column_value(column, cursor)
+            for column in message_payload["identity"]
+            if column["name"] in properties
+        }
+        row["_sdc_deleted_at"] = self._deleted_at_timestamp()
+        row["_sdc_lsn"] = message.data_start
         return row
 
-    def _parse_column_value(self, column, cursor):
-        # When using log based replication, the wal2json output for columns of
-        # array types returns a string encoded in sql format, e.g. '{a,b}'
-        # https://github.com/eulerto/wal2json/issues/221#issuecomment-1025143441
-        if column["type"] == "text[]":
-            return psycopg2.extensions.STRINGARRAY(column["value"], cursor)
+    def _deleted_at_timestamp(self) -> str:
+        """Return the current UTC time as an _sdc_deleted_at string.
+
+        The string has a resolution of one second, so it is only reformatted when the
+        second changes rather than for every deleted row.
+        """
+        now = int(time.time())
+        if now != self._deleted_at_second:
+            self._deleted_at_second = now
+            self._deleted_at = _format_utc_timestamp(now)
+        return self._deleted_at
+
+    def _consume_truncate(self, message, message_payload, cursor) -> dict:
+        """Skip a truncate WAL message."""
+        self.logger.debug(
+            (
+                "A message payload of %s (corresponding to a truncate action) "
+                "could not be processed."
+            ),
+            message.payload,
+        )
+        return {}
+
+    def _consume_transaction(self, message, message_payload, cursor) -> dict:
+        """Skip a transaction begin or commit WAL message."""
+        self.logger.debug(
+            (
+                "A message payload of %s (corresponding to a transaction beginning "
+                "or commit) could not be processed."
+            ),
+            message.payload,
+        )
+        return {}
+
+    # wal2json action type -> consume handler, resolved with a single lookup per message
+    _ACTION_HANDLERS: t.ClassVar[dict[str, t.Callable[..., dict]]] = {
+        "I": _consume_upsert,
+        "U": _consume_upsert,
+        "D": _consume_delete,
+        "T": _consume_truncate,
+        "B": _consume_transaction,
+        "C": _consume_transaction,
+    }
+
+    @functools.cached_property
+    def _column_parsers(self) -> dict[str, t.Callable | None]:
+        """Parser of each column seen in a WAL message, or None if it needs none."""
+        return {}
 
-        return column["value"]
+    def _parse_column_value(self, column, cursor):
+        name = column["name"]
+        try:
+            parser = self._column_parsers[name]
+        except KeyError:
+            # Resolve the parser from the column type the first time a column is seen
+            parser = self._column_parsers[name] = _WAL2JSON_PARSERS.get(column["type"])
+        if parser is None:
+            return column["value"]
+        return parser(column["value"], cursor)
 
     def logical_replication_connection(self):
         """A logical replication connection to the database.
 
         Uses a direct psycopg2 implementation rather than through sqlalchemy.
         """
-        connection_string = (
-            f"dbname={self.config['database']} "
-            f"user={self.config['user']} "
-            f"password={self.config['password']} "
-            f"host={self.config['host']} "
-            f"port={self.config['port']}"
-        )
         return psycopg2.connect(
-            connection_string,
-            application_name="tap_postgres",
+            self._replication_dsn,
             connection_factory=extras.LogicalReplicationConnection,
         )
 
+    @functools.cached_property
+    def _replication_dsn(self) -> str:
+        """The connection string for the logical replication connection."""
+        return psycopg2.extensions.make_dsn(
+            dbname=self.config["database"],
+            user=self.config["user"],
+            password=self.config["password"],
+            host=self.config["host"],
+            port=self.config["port"],
+            application_name="tap_postgres",
+        )
+
     # TODO: Make this change upstream in the SDK?
     # I'm not sure if in general SQL databases don't guarantee order of records log
     # replication, but at least Postgres does not.
@@ -35,6 +35,21 @@ if TYPE_CHECKING:
 
 REPLICATION_SLOT_PATTERN = "^(?!pg_)[A-Za-z0-9_]{1,63}$"
 
+# Longest filepath accepted by Linux (PATH_MAX).
+_MAX_PATH_LENGTH = 4096
+
+
+def _looks_like_pem(value: str) -> bool:
+    """Return whether a value is an inline certificate or key rather than a filepath.
+
+    Args:
+        value: A filepath or the contents of a certificate or key.
+
+    Returns:
+        True if the value can't be a filepath.
+    """
+    return value.startswith("-----") or "\n" in value or len(value) > _MAX_PATH_LENGTH
+
 
 class TapPostgres(SQLTap):
     """Singer tap for Postgres."""
@@ -164,6 +179,24 @@ class TapPostgres(SQLTap):
                 "Optional. The maximum number of records to return in a single stream."
             ),
         ),
+        th.Property(
+            "fetch_size",
+            th.IntegerType(minimum=1),
+            default=5000,
+            description=(
+                "The number of rows to fetch from the server-side cursor in a single "
+                "round trip when reading a stream."
+            ),
+        ),
+        th.Property(
+            "wal_batch_size",
+            th.IntegerType(minimum=1),
+            default=1000,
+            description=(
+                "The number of rows to read from the WAL before reporting progress to "
+                "the server. Only applicable when replication_method is LOG_BASED."
+            ),
+        ),
         th.Property(
             "sqlalchemy_url",
             th.StringType,
@@ -424,7 +457,8 @@ class TapPostgres(SQLTap):
             A dictionary with key-value pairs for the sqlalchemy query
 
         """
-        if path.isfile(value):
+        # A PEM certificate or key can never be a filepath, so don't stat it.
+        if not _looks_like_pem(value) and path.isfile(value):
             return value
 
         with open(alternative_name, "wb") as alternative_file:
@@ -608,8 +642,9 @@ class TapPostgres(SQLTap):
         if modified_streams:
             self.logger.info(
                 "One or more LOG_BASED catalog entries were modified "
-                f"({modified_streams=}) to allow nullability and include _sdc columns. "
-                "See README for further information."
+                "(modified_streams=%r) to allow nullability and include _sdc columns. "
+                "See README for further information.",
+                modified_streams,
             )
         return new_catalog
 
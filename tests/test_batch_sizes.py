@@ -0,0 +1,53 @@
+from unittest import mock
+
+import pytest
+from singer_sdk.exceptions import ConfigValidationError
+
+from tap_postgres.client import PostgresLogBasedStream
+from tap_postgres.tap import TapPostgres
+from tests.settings import DB_SQLALCHEMY_URL
+
+
+@pytest.mark.parametrize("fetch_size", [0, -1])
+def test_invalid_fetch_size(fetch_size: int):
+    """Test validation for fetch sizes that would fetch no rows."""
+    config = {"sqlalchemy_url": DB_SQLALCHEMY_URL, "fetch_size": fetch_size}
+
+    with pytest.raises(ConfigValidationError):
+        TapPostgres(config=config, setup_mapper=False)
+
+
+@pytest.mark.parametrize("wal_batch_size", [0, -1])
+def test_invalid_wal_batch_size(wal_batch_size: int):
+    """Test validation for WAL batch sizes that would never report progress."""
+    config = {"sqlalchemy_url": DB_SQLALCHEMY_URL, "wal_batch_size": wal_batch_size}
+
+    with pytest.raises(ConfigValidationError):
+        TapPostgres(config=config, setup_mapper=False)
+
+
+def test_flush_batch():
+    """A batch is yielded in order, then its last LSN is reported once."""
+    cursor = mock.Mock()
+    batch = [{"id": 1, "_sdc_lsn": 10}, {"id": 2, "_sdc_lsn": 11}]
+    expected = list(batch)
+
+    flushed = PostgresLogBasedStream._flush_batch(mock.Mock(), batch, cursor)
+    yielded = []
+    for row in flushed:
+        # No progress is reported for a batch before all its rows are yielded.
+        cursor.send_feedback.assert_not_called()
+        yielded.append(row)
+
+    assert yielded == expected
+    cursor.send_feedback.assert_called_once_with(write_lsn=11)
+    assert batch == []
+
+    batch.append({"id": 3, "_sdc_lsn": 12})
+    assert list(PostgresLogBasedStream._flush_batch(mock.Mock(), batch, cursor)) == [
+        {"id": 3, "_sdc_lsn": 12}
+    ]
+    assert cursor.send_feedback.call_args_list == [
+        mock.call(write_lsn=11),
+        mock.call(write_lsn=12),
+    ]
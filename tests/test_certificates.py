@@ -0,0 +1,26 @@
+from tap_postgres.tap import _MAX_PATH_LENGTH, _looks_like_pem
+
+PEM = """-----BEGIN CERTIFICATE-----
+MIIBszCCAVmgAwIBAgIUdGVzdA==
+-----END CERTIFICATE-----
+"""
+
+
+def test_pem_body_is_not_a_path():
+    assert _looks_like_pem(PEM)
+
+
+def test_one_line_path_is_a_path():
+    assert not _looks_like_pem("./ssl/root.crt")
+    assert not _looks_like_pem("/etc/ssl/certs/root.crt")
+
+
+def test_overlong_value_is_not_a_path():
+    value = "a" * (_MAX_PATH_LENGTH + 1)
+    assert _looks_like_pem(value)
+    assert not _looks_like_pem(value[:_MAX_PATH_LENGTH])
+
+
+def test_multiline_value_is_not_a_path():
+    """A newline can't be in a usable path, even without PEM armour."""
+    assert _looks_like_pem("MIIBszCCAVmgAwIBAgIU\ndGVzdA==")
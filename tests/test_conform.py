@@ -0,0 +1,140 @@
+import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+import singer_sdk.helpers._typing
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from tap_postgres import client
+from tap_postgres.client import PostgresStream, _nullable_type, patched_conform
+
+
+def test_conform_temporal_values():
+    """Dates and timestamps are conformed to their ISO 8601 representation."""
+    assert patched_conform(datetime.date(2022, 3, 19), {}) == "2022-03-19"
+    assert (
+        patched_conform(datetime.datetime(1918, 2, 3, 13, 0, 1), {})
+        == "1918-02-03T13:00:01"
+    )
+    assert (
+        patched_conform(
+            datetime.datetime(2022, 3, 19, 6, 4, 19, tzinfo=datetime.timezone.utc), {}
+        )
+        == "2022-03-19T06:04:19+00:00"
+    )
+    assert patched_conform(datetime.time(6, 4, 19, 222000), {}) == "06:04:19.222000"
+
+
+def test_conform_subclassed_values():
+    """Subclasses of the conformed types are conformed like their base type."""
+
+    class SubDateTime(datetime.datetime):
+        pass
+
+    assert (
+        patched_conform(SubDateTime(2022, 3, 19, 6, 4, 19), {}) == "2022-03-19T06:04:19"
+    )
+    assert patched_conform(bytearray(b"\x01"), {}) == bytearray(b"\x01")
+    assert patched_conform(b"\x01\xff", {"type": ["string"]}) == "01ff"
+
+
+def test_conform_rows_by_column():
+    """Only the listed columns of a batch of rows are conformed."""
+    rows = [
+        (1, datetime.date(2022, 3, 19), b"\x01"),
+        (2, datetime.date(2022, 3, 20), b"\x00"),
+    ]
+    conformers = [(1, datetime.date.isoformat)]
+    assert list(PostgresStream._conform_rows(rows, conformers)) == [
+        (1, "2022-03-19", b"\x01"),
+        (2, "2022-03-20", b"\x00"),
+    ]
+
+
+def _column_conformer(column: sa.Column, property_schema: dict, **config):
+    """Return the conformer a stream with the given column schema picks."""
+    stream = SimpleNamespace(
+        config=config, schema={"properties": {column.name: property_schema}}
+    )
+    return PostgresStream.column_conformer(stream, column)  # type: ignore[arg-type]
+
+
+def test_bytes_boolean_check_runs_once_per_column():
+    """Whether bytes are a BIT value is checked once per column, not per value."""
+    column = sa.Column("data", postgresql.BYTEA())
+    with mock.patch(
+        "singer_sdk.helpers._typing.is_boolean_type",
+        wraps=singer_sdk.helpers._typing.is_boolean_type,
+    ) as is_boolean_type:
+        conformer = _column_conformer(column, {"type": ["string", "null"]})
+        assert conformer is not None
+        values = [conformer(value) for value in (b"\x01\xff", None, b"\x00")]
+    assert values == ["01ff", None, "00"]
+    is_boolean_type.assert_called_once()
+
+    conformer = _column_conformer(column, {"type": ["boolean", "null"]})
+    assert conformer is not None
+    assert [conformer(value) for value in (b"\x01", b"\x00", None)] == [
+        True,
+        False,
+        None,
+    ]
+
+
+def test_domain_columns_conformed_as_underlying_type():
+    """Columns of a domain are conformed like columns of the domain's type."""
+    column = sa.Column("created_at", postgresql.DOMAIN("ts_domain", sa.DateTime()))
+    conformer = _column_conformer(column, {"type": ["string", "null"]})
+    assert conformer is not None
+    assert conformer(datetime.datetime(2022, 3, 19, 6, 4, 19)) == "2022-03-19T06:04:19"
+    assert conformer(None) is None
+
+    column = sa.Column("amount", postgresql.DOMAIN("int_domain", sa.Integer()))
+    assert _column_conformer(column, {"type": ["integer", "null"]}) is None
+
+
+def test_unlisted_columns_conformed_generically():
+    """Columns of a type without a specific conformer still have values conformed."""
+    column = sa.Column("flag", postgresql.BIT())
+    conformer = _column_conformer(column, {"type": ["boolean", "null"]})
+    assert conformer is not None
+    assert conformer(b"\x00") is False
+    assert conformer(datetime.date(2022, 3, 19)) == "2022-03-19"
+
+
+def test_nullable_type():
+    """JSON schema types are made nullable without duplicating "null"."""
+    assert _nullable_type("string") == ["string", "null"]
+    assert _nullable_type(["integer"]) == ["integer", "null"]
+    assert _nullable_type(["string", "null"]) == ["string", "null"]
+    assert _nullable_type("null") == ["null"]
+
+
+def test_dates_read_as_strings_by_another_connector(monkeypatch):
+    """Date values already read as strings pass through, even without the setting.
+
+    The string date casters are process-wide, so once any connector registers them,
+    streams without dates_as_string also receive strings.
+    """
+    monkeypatch.setattr(client, "_string_date_types_registered", True)
+    for column_type in (postgresql.DATE(), postgresql.TIMESTAMP()):
+        column = sa.Column("value", column_type)
+        assert _column_conformer(column, {"type": ["string", "null"]}) is None
+
+    monkeypatch.setattr(client, "_string_date_types_registered", False)
+    column = sa.Column("value", postgresql.DATE())
+    conformer = _column_conformer(column, {"type": ["string", "null"]})
+    assert conformer is not None
+    assert conformer(datetime.date(2022, 3, 19)) == "2022-03-19"
+
+
+def test_conformer_for_column_named_in_another_case():
+    """A column is conformed by the catalog property differing from it only in case."""
+    stream = SimpleNamespace(
+        config={}, schema={"properties": {"flag": {"type": ["boolean", "null"]}}}
+    )
+    column = sa.Column("Flag", postgresql.BYTEA())
+    conformer = PostgresStream.column_conformer(stream, column)  # type: ignore[arg-type]
+    assert conformer is not None
+    assert conformer(b"\x00") is False
@@ -200,6 +200,56 @@ def test_temporal_datatypes():
     }
 
 
+def test_infinite_dates():
+    """Infinite dates are read as the furthest dates Python can represent.
+
+    Only date values are checked here: BC dates and years past 9999 can't be read
+    without dates_as_string, which test_invalid_python_dates covers.
+    """
+    table_name = "test_infinite_dates"
+    engine = sa.create_engine(SAMPLE_CONFIG["sqlalchemy_url"], future=True)
+
+    metadata_obj = sa.MetaData()
+    table = sa.Table(
+        table_name,
+        metadata_obj,
+        sa.Column("id", BIGINT),
+        sa.Column("column_date", DATE),
+    )
+    with engine.begin() as conn:
+        table.drop(conn, checkfirst=True)
+        metadata_obj.create_all(conn)
+        insert = table.insert().values(
+            [
+                {"id": 1, "column_date": "infinity"},
+                {"id": 2, "column_date": "-infinity"},
+            ]
+        )
+        conn.execute(insert)
+    tap = TapPostgres(config=SAMPLE_CONFIG)
+    tap_catalog = json.loads(tap.catalog_json_text)
+    altered_table_name = f"{DB_SCHEMA_NAME}-{table_name}"
+    for stream in tap_catalog["streams"]:
+        if stream.get("stream") and altered_table_name not in stream["stream"]:
+            for metadata in stream["metadata"]:
+                metadata["metadata"]["selected"] = False
+        else:
+            for metadata in stream["metadata"]:
+                metadata["metadata"]["selected"] = True
+                if metadata["breadcrumb"] == []:
+                    metadata["metadata"]["replication-method"] = "FULL_TABLE"
+
+    test_runner = PostgresTestRunner(
+        tap_class=TapPostgres, config=SAMPLE_CONFIG, catalog=tap_catalog
+    )
+    test_runner.sync_all()
+    records = sorted(test_runner.records[altered_table_name], key=lambda r: r["id"])
+    assert records == [
+        {"id": 1, "column_date": "9999-12-31"},
+        {"id": 2, "column_date": "0001-01-01"},
+    ]
+
+
 def test_jsonb_json():
     """JSONB and JSON Objects weren't being selected, make sure they are now."""
     table_name = "test_jsonb_json"
@@ -1,8 +1,15 @@
+import calendar
+import datetime
 import json
+from types import SimpleNamespace
+from unittest import mock
 
 import sqlalchemy as sa
+from hypothesis import given
+from hypothesis import strategies as st
 from sqlalchemy.dialects.postgresql import ARRAY, BIGINT, TEXT
 
+from tap_postgres.client import PostgresLogBasedStream, _format_utc_timestamp
 from tap_postgres.tap import TapPostgres
 from tests.test_core import PostgresTestRunner
 
@@ -107,3 +114,54 @@ def test_string_array_column():
     test_runner.sync_all()
     assert test_runner.record_messages[0]["record"]["data"] == ["1", "2"]
     assert test_runner.record_messages[1]["record"]["data"] == ['This is a "test"', "2"]
+
+
+def _utc_timestamp(seconds: int) -> str:
+    return datetime.datetime.utcfromtimestamp(seconds).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@given(st.integers(min_value=0, max_value=253402300799))
+def test_format_utc_timestamp(seconds: int):
+    """_sdc_deleted_at is formatted as datetime would format it."""
+    assert _format_utc_timestamp(seconds) == _utc_timestamp(seconds)
+
+
+def test_format_utc_timestamp_zero_padding():
+    """Every field of _sdc_deleted_at is zero-padded to a fixed width."""
+    seconds = calendar.timegm((1987, 1, 2, 3, 4, 5, 0, 0, 0))
+    assert _format_utc_timestamp(seconds) == "1987-01-02T03:04:05Z"
+    assert _format_utc_timestamp(0) == _utc_timestamp(0) == "1970-01-01T00:00:00Z"
+
+
+def test_deleted_at_timestamp_follows_the_clock():
+    """A new _sdc_deleted_at is returned once the second changes."""
+    stream = SimpleNamespace(_deleted_at_second=-1, _deleted_at="")
+    with mock.patch("time.time", side_effect=[1700000000.2, 1700000001.0]):
+        first = PostgresLogBasedStream._deleted_at_timestamp(stream)
+        second = PostgresLogBasedStream._deleted_at_timestamp(stream)
+
+    assert first == _utc_timestamp(1700000000)
+    assert second == _utc_timestamp(1700000001)
+
+
+def test_deleted_at_timestamp_reused_within_a_second():
+    """_sdc_deleted_at is only reformatted when the second rolls over."""
+    stream = SimpleNamespace(_deleted_at_second=-1, _deleted_at="")
+    clock = [1700000000.0, 1700000000.5, 1700000000.999, 1700000001.0]
+    format_utc_timestamp = mock.Mock(wraps=_format_utc_timestamp)
+    with (
+        mock.patch("time.time", side_effect=clock),
+        mock.patch("tap_postgres.client._format_utc_timestamp", format_utc_timestamp),
+    ):
+        values = [PostgresLogBasedStream._deleted_at_timestamp(stream) for _ in clock]
+
+    assert values == [
+        "2023-11-14T22:13:20Z",
+        "2023-11-14T22:13:20Z",
+        "2023-11-14T22:13:20Z",
+        "2023-11-14T22:13:21Z",
+    ]
+    assert format_utc_timestamp.call_args_list == [
+        mock.call(1700000000),
+        mock.call(1700000001),
+    ]
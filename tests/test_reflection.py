@@ -0,0 +1,73 @@
+from unittest import mock
+
+import pytest
+import sqlalchemy as sa
+from singer_sdk import SQLConnector
+
+from tap_postgres.client import PostgresConnector
+from tests.settings import DB_SQLALCHEMY_URL
+
+COLUMNS = [
+    {"name": "ID", "type": sa.BigInteger(), "nullable": False},
+    {"name": "Amount", "type": sa.Numeric(), "nullable": True},
+    {"name": "note", "type": sa.Text()},
+]
+
+
+@pytest.fixture
+def inspector():
+    inspector = mock.Mock()
+    inspector.get_multi_columns.return_value = {("public", "orders"): COLUMNS}
+    inspector.get_columns.return_value = COLUMNS
+    return inspector
+
+
+@pytest.fixture
+def connector(inspector):
+    connector = PostgresConnector(
+        config={"sqlalchemy_url": DB_SQLALCHEMY_URL}, sqlalchemy_url=DB_SQLALCHEMY_URL
+    )
+    connector.__dict__["inspector"] = inspector
+    return connector
+
+
+def _describe(columns: dict[str, sa.Column]) -> list[tuple[str, type, bool]]:
+    return [
+        (name, type(column.type), column.nullable) for name, column in columns.items()
+    ]
+
+
+@pytest.mark.parametrize("column_names", [None, [], ["id", "AMOUNT"], ["Note"]])
+def test_table_columns_match_sdk(connector, inspector, column_names):
+    """Columns are filtered and built the same way the SDK does it."""
+    sdk_connector = SQLConnector(sqlalchemy_url=DB_SQLALCHEMY_URL)
+    with mock.patch("sqlalchemy.inspect", return_value=inspector):
+        expected = sdk_connector.get_table_columns("public.orders", column_names)
+
+    columns = connector.get_table_columns("public.orders", column_names)
+
+    assert _describe(columns) == _describe(expected)
+    inspector.get_multi_columns.assert_called_once()
+
+
+def test_table_missing_from_bulk_reflection(connector, inspector):
+    """A table the bulk reflection didn't return is reflected on its own."""
+    inspector.get_multi_columns.return_value = {}
+
+    columns = connector.get_table_columns("public.orders")
+
+    assert list(columns) == ["ID", "Amount", "note"]
+    inspector.get_columns.assert_called_once_with("orders", "public")
+
+
+def test_table_columns_cached_per_column_filter(connector, inspector):
+    """Each column filter of a table gets its own columns, reflected only once."""
+    assert list(connector.get_table_columns("public.orders", ["id"])) == ["ID"]
+    assert list(connector.get_table_columns("public.orders", ["note"])) == ["note"]
+    assert list(connector.get_table_columns("public.orders")) == [
+        "ID",
+        "Amount",
+        "note",
+    ]
+    assert list(connector.get_table_columns("public.orders", ["ID"])) == ["ID"]
+    inspector.get_multi_columns.assert_called_once()